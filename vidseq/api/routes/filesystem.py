@@ -1,3 +1,4 @@
+import os
 from fastapi import APIRouter, HTTPException, Query
 from pathlib import Path
 from vidseq.schemas.filesystem import DirectoryEntry
@@ -16,12 +17,15 @@ async def list_directory(path: str = Query(..., description="Directory path to l
     
     entries = []
     try:
-        for item in dir_path.iterdir():
-            entries.append(DirectoryEntry(
-                name=item.name,
-                path=str(item.absolute()),
-                is_directory=item.is_dir()
-            ))
+        # scandir reports entry types from the directory listing itself,
+        # avoiding a stat() per entry on large folders
+        with os.scandir(dir_path.absolute()) as it:
+            for item in it:
+                entries.append(DirectoryEntry(
+                    name=item.name,
+                    path=item.path,
+                    is_directory=item.is_dir()
+                ))
     except PermissionError:
         raise HTTPException(status_code=403, detail=f"Permission denied accessing directory: {path}")
     
@@ -37,9 +37,8 @@ async def stream_logs(
             yield "data: Waiting for log file...\n\n"
             while not log_path.exists() and job.status == "pending":
                 await asyncio.sleep(0.5)
-                result = await db.execute(select(Job).where(Job.id == job_id))
-                job_fresh = result.scalar_one()
-                if job_fresh.status != "pending":
+                result = await db.execute(select(Job.status).where(Job.id == job_id))
+                if result.scalar_one() != "pending":
                     break
         
         if not log_path.exists():
@@ -47,22 +46,22 @@ async def stream_logs(
             return
         
         with open(log_path, 'r') as f:
-            existing = f.read()
-            if existing:
-                for line in existing.splitlines():
-                    yield f"data: {line}\n\n"
-            
+            # Lines already in the log are streamed by the same loop as new
+            # ones, so large logs are never read into memory at once
             while True:
-                result = await db.execute(select(Job).where(Job.id == job_id))
-                current_job = result.scalar_one()
-                
                 line = f.readline()
                 if line:
                     yield f"data: {line.rstrip()}\n\n"
-                elif current_job.status in ["completed", "failed"]:
+                    continue
+                
+                # Only poll the job status once we've caught up with the log
+                result = await db.execute(select(Job.status).where(Job.id == job_id))
+                if result.scalar_one() in ["completed", "failed"]:
+                    for line in f:
+                        yield f"data: {line.rstrip()}\n\n"
                     break
-                else:
-                    await asyncio.sleep(0.1)
+                
+                await asyncio.sleep(0.1)
     
     return StreamingResponse(
         event_generator(),
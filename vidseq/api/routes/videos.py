@@ -42,8 +42,5 @@ async def add_videos(
     
     await session.commit()
     
-    for video in added_videos:
-        await session.refresh(video)
-    
     return added_videos
 
@@ -3,17 +3,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from vidseq import __version__
 from vidseq.api.routes import projects, videos, filesystem, jobs, segmentation
-from vidseq.database import init_registry_db, registry_engine, project_engines
+from vidseq import database
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    await init_registry_db()
+    await database.init_registry_db()
     yield
     # Shutdown
-    if registry_engine:
-        await registry_engine.dispose()
-    for engine in project_engines.values():
+    if database.registry_engine:
+        await database.registry_engine.dispose()
+    for engine in database.project_engines.values():
         await engine.dispose()
 
 app = FastAPI(